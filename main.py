@@ -1,4 +1,5 @@
 import os
+import re
 import discord
 import time
 import asyncio
@@ -9,23 +10,43 @@ import zipfile
 import stat
 import shutil
 import random
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
+import atexit
+import signal
+import concurrent.futures
+import collections
+import functools
+import pathlib
+import aiohttp
+import orjson
 from discord.ext import tasks
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    SELENIUM_AVAILABLE = True
+except ImportError:  # The price API works without a browser; only the scrape fallback needs selenium
+    SELENIUM_AVAILABLE = False
+
+try:
+    import uvloop
+except ImportError:  # uvloop isn't available on Windows
+    uvloop = None
 
 # Load environment variables
 load_dotenv()
 
+# Setup logging; set LOG_LEVEL=DEBUG to see per-cycle fetch details. Only this bot's
+# logger follows it, so selenium, urllib3 and discord.py stay at INFO
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
 # Fetch and validate environment variables
 DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 VOICE_CHANNEL_ID = os.getenv("VOICE_CHANNEL_ID")
@@ -40,6 +61,117 @@ try:
 except ValueError:
     raise ValueError("❌ VOICE_CHANNEL_ID must be a valid integer.")
 
+# Direct price API (Jupiter) used before falling back to the browser scrape
+ANA_MINT = os.getenv("ANA_MINT", "ANAxByE6G2WjFp7A4NqtWYXb3mgruyzZYg3spfxe6Lbo")
+PRICE_API_URL = os.getenv("PRICE_API_URL", "https://lite-api.jup.ag/price/v3")
+
+# Assets priced through the API, symbol -> mint; all are fetched in a single request
+PRICE_ASSETS = {"ANA": ANA_MINT}
+
+# Set BROWSER_FALLBACK=0 to never launch Chrome, even when the price API fails
+BROWSER_FALLBACK = os.getenv("BROWSER_FALLBACK", "1").lower() not in ("0", "false", "no")
+
+# Poll every 3 minutes, backing off up to 12 minutes while the price sits still
+POLL_INTERVAL = 180
+MAX_POLL_INTERVAL = 720
+UNCHANGED_CYCLES_BEFORE_BACKOFF = 3
+# Up to this many seconds are added to each wait so polls don't tick in lockstep
+POLL_JITTER = 10
+
+# Discord allows 2 channel renames per 10 minutes
+CHANNEL_EDIT_LIMIT = 2
+CHANNEL_EDIT_WINDOW = 600
+# Polls in a row the price must differ from the channel before a rename is spent on it
+CHANNEL_EDIT_CONFIRMATIONS = 2
+
+# Last channel price, kept on disk so a restart doesn't spend a rename on an unchanged price
+LAST_PRICE_PATH = pathlib.Path(os.getenv("PRICE_CACHE", "/tmp/ana_last_price"))
+
+# Downloaded ChromeDrivers, one directory per Chrome major version, kept across restarts
+# (normalised once so paths built from it compare reliably, e.g. with a trailing slash or ~)
+CHROMEDRIVER_CACHE_DIR = os.path.abspath(os.path.expanduser(os.getenv("CHROMEDRIVER_CACHE", "~/.cache/chromedriver")))
+
+# Restart the shared browser after this many failed scrape attempts in a row
+MAX_DRIVER_FAILURES = 3
+# Restart it after this many page loads anyway, before a long-lived Chrome bloats
+MAX_DRIVER_USES = 100
+
+# Chrome features the headless scrape never uses
+CHROME_DISABLED_FEATURES = (
+    "Translate",
+    "TranslateUI",
+    "VizDisplayCompositor",
+    "BackForwardCache",
+    "MediaRouter",
+    "OptimizationHints",
+    "InterestFeedContentSuggestions",
+    # Site isolation spawns a renderer per origin; one trusted page doesn't need it
+    "IsolateOrigins",
+    "site-per-process",
+)
+
+# Requests the mint page makes that the price does not depend on: static assets
+# (the price is read from textContent, so nothing needs styling or images) and analytics
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.ico",
+    "*.mp4",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.css",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*segment.io*",
+    "*sentry.io*",
+    "*sentry-cdn.com*",
+    "*intercom.io*",
+]
+
+# The mint page's price element; the page has several DataPoints (APY, floor, ...)
+# and the price is the first of them
+PRICE_SELECTOR = ".DataPoint_dataPointValue__Bzf_E"
+
+# Looser locators, tried in order only once the primary selector has timed out;
+# XPath fallbacks expressed as CSS
+FALLBACK_PRICE_SELECTORS = (
+    "[class*='DataPoint_dataPointValue']",
+    "[class*='dataPointValue']",
+    "[data-testid*='price']",
+    ".price-value",
+    "[class*='price']",
+    "span[class*='DataPoint']",
+    "div[class*='DataPoint'] span",
+)
+
+# Reads the first element of each selector inside the page, so each check is a single
+# WebDriver round-trip; later elements are other metrics and are never considered
+_FIND_PRICE_JS = """
+    for (const selector of arguments[0]) {
+        const element = document.querySelector(selector);
+        const text = element ? (element.textContent || "").trim() : "";
+        // Same number pattern as _PRICE_RE; a zero is a loading placeholder, not a price
+        const match = text.match(/\\d[\\d,]*(?:\\.\\d+)?/);
+        if (match && parseFloat(match[0].replace(/,/g, "")) > 0) return [text, selector];
+    }
+    return null;
+"""
+
+# Matches a full Chrome version such as "138.0.7204.183"
+_CHROME_VERSION_RE = re.compile(r"\d+\.\d+\.\d+\.\d+")
+
+# Matches the numeric part of a rendered price such as "$1,234.5678 USDC"
+_PRICE_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+# Both price sources are shown with this many decimals so switching between them
+# doesn't rename the channel over formatting alone
+PRICE_DECIMALS = 4
+
 # Setup Discord client
 intents = discord.Intents.default()
 intents.guilds = True
@@ -47,13 +179,56 @@ intents.voice_states = True
 client = discord.Client(intents=intents)
 
 last_price = None
+last_status_price = None
+http_session = None
+_driver = None
+_driver_failures = 0
+_driver_uses = 0
+_chrome_setup = None
+_channel_edits = collections.deque()
+_unchanged_cycles = 0
+_poll_interval = POLL_INTERVAL
+_pending_count = 0
+_api_etag = None
+_api_prices = {}
+
+# Dedicated thread for the blocking Selenium scrape so it never competes with
+# the default executor that discord.py and aiohttp use for DNS lookups
+_fetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="selenium")
+atexit.register(_fetch_executor.shutdown, wait=False)
 
+# One pooled session for the ChromeDriver version lookup and download; transient
+# server errors are retried here rather than dropping straight to the fallback version
+_download_session = requests.Session()
+_download_session.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+))
+
+def _parse_price(value):
+    """Normalise a scraped price string or an API number to the displayed price string"""
+    if isinstance(value, str):
+        match = _PRICE_RE.search(value)
+        if not match:
+            return None
+        value = match.group(0).replace(",", "")
+    try:
+        price = float(value)
+    except (TypeError, ValueError):
+        return None
+    # Non-positive values are placeholders or bad data, never a real price
+    if not price > 0:
+        return None
+    return f"{price:.{PRICE_DECIMALS}f}"
+
+@functools.lru_cache(maxsize=1)
 def find_chrome_binary():
     """Find Chrome/Chromium binary location"""
     # Check if Railway provides a Chrome binary path
     railway_chrome = os.environ.get("GOOGLE_CHROME_BIN")
     if railway_chrome and os.path.exists(railway_chrome):
-        logger.info(f"✅ Found Railway Chrome binary: {railway_chrome}")
+        logger.info("✅ Found Railway Chrome binary: %s", railway_chrome)
         return railway_chrome
     
     possible_paths = [
@@ -69,33 +244,53 @@ def find_chrome_binary():
     
     for path in possible_paths:
         if os.path.exists(path):
-            logger.info(f"✅ Found Chrome binary: {path}")
+            logger.info("✅ Found Chrome binary: %s", path)
             return path
     
     logger.error("❌ No Chrome binary found")
     return None
 
+def read_chrome_version_file(chrome_path):
+    """Read Chrome's version from a VERSION file shipped next to the binary, if any"""
+    # Only the resolved binary's own directory; another install's VERSION would report
+    # the wrong major and fetch a ChromeDriver that can't drive this binary
+    chrome_dir = os.path.dirname(os.path.realpath(chrome_path))
+    try:
+        with open(os.path.join(chrome_dir, "VERSION")) as version_file:
+            match = _CHROME_VERSION_RE.search(version_file.read())
+    except OSError:
+        return None
+    return match.group(0) if match else None
+
+@functools.lru_cache(maxsize=4)
 def get_chrome_version(chrome_path):
     """Get Chrome version and extract major version number"""
+    # Reading a file is far cheaper than forking Chrome just to print its version
+    version_number = read_chrome_version_file(chrome_path)
+    if version_number:
+        major_version = version_number.split('.')[0]
+        logger.info("✅ Chrome version (from VERSION file): %s", version_number)
+        return version_number, major_version
+    
     try:
         result = subprocess.run([chrome_path, "--version"], 
                               capture_output=True, text=True, timeout=10)
         if result.returncode == 0:
             version_output = result.stdout.strip()
-            logger.info(f"✅ Chrome version: {version_output}")
+            logger.info("✅ Chrome version: %s", version_output)
             
             # Extract version number (e.g., "Google Chrome 138.0.7204.183" -> "138.0.7204.183")
             version_parts = version_output.split()
             version_number = version_parts[-1]  # Get the last part which should be the version
             major_version = version_number.split('.')[0]  # Get major version (138)
             
-            logger.info(f"✅ Chrome major version: {major_version}")
+            logger.info("✅ Chrome major version: %s", major_version)
             return version_number, major_version
         else:
-            logger.error(f"❌ Failed to get Chrome version: {result.stderr}")
+            logger.error("❌ Failed to get Chrome version: %s", result.stderr)
             return None, None
     except Exception as e:
-        logger.error(f"❌ Error getting Chrome version: {e}")
+        logger.error("❌ Error getting Chrome version: %s", e)
         return None, None
 
 def download_compatible_chromedriver(major_version):
@@ -103,37 +298,43 @@ def download_compatible_chromedriver(major_version):
     try:
         # Check if Railway provides chromedriver path
         railway_chromedriver = os.environ.get("CHROMEDRIVER_PATH")
-        if railway_chromedriver and os.path.exists(railway_chromedriver):
-            logger.info(f"✅ Using Railway ChromeDriver: {railway_chromedriver}")
+        if railway_chromedriver and os.access(railway_chromedriver, os.X_OK):
+            logger.info("✅ Using Railway ChromeDriver: %s", railway_chromedriver)
             return railway_chromedriver
         
-        # ChromeDriver directory
-        driver_dir = "/tmp/chromedriver_new"
+        # ChromeDriver directory, keyed by major version so a Chrome upgrade gets a fresh driver
+        driver_dir = os.path.join(CHROMEDRIVER_CACHE_DIR, major_version)
         driver_path = os.path.join(driver_dir, "chromedriver")
         
-        # Remove old directory if exists
+        # The directory only ever holds a driver that passed its version check for this
+        # major, so an executable file is enough; a broken one fails at startup and is dropped
+        if os.access(driver_path, os.X_OK):
+            logger.info("✅ Using cached ChromeDriver: %s", driver_path)
+            return driver_path
+        
+        # Remove a stale or partial download
         if os.path.exists(driver_dir):
             shutil.rmtree(driver_dir)
         
         # Create fresh directory
         os.makedirs(driver_dir, exist_ok=True)
         
-        logger.info(f"📥 Downloading ChromeDriver for Chrome {major_version}...")
+        logger.info("📥 Downloading ChromeDriver for Chrome %s...", major_version)
         
         # Chrome 115+ uses new ChromeDriver API
         if int(major_version) >= 115:
             try:
                 # Try to get the exact ChromeDriver version for this Chrome version
                 api_url = f"https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_{major_version}"
-                logger.info(f"🔍 Checking API: {api_url}")
+                logger.info("🔍 Checking API: %s", api_url)
                 
-                response = requests.get(api_url, timeout=30)
+                response = _download_session.get(api_url, timeout=30)
                 if response.status_code == 200:
                     driver_version = response.text.strip()
-                    logger.info(f"✅ Found ChromeDriver version: {driver_version}")
+                    logger.info("✅ Found ChromeDriver version: %s", driver_version)
                     download_url = f"https://storage.googleapis.com/chrome-for-testing-public/{driver_version}/linux64/chromedriver-linux64.zip"
                 else:
-                    logger.warning(f"⚠️ API returned {response.status_code}, using fallback version")
+                    logger.warning("⚠️ API returned %s, using fallback version", response.status_code)
                     # Use a known working version for Chrome 138
                     if major_version == "138":
                         driver_version = "138.0.6906.100"
@@ -142,7 +343,7 @@ def download_compatible_chromedriver(major_version):
                     download_url = f"https://storage.googleapis.com/chrome-for-testing-public/{driver_version}/linux64/chromedriver-linux64.zip"
                     
             except Exception as e:
-                logger.warning(f"⚠️ New API failed: {e}, using fallback")
+                logger.warning("⚠️ New API failed: %s, using fallback", e)
                 # Fallback version
                 if major_version == "138":
                     driver_version = "138.0.6906.100"
@@ -153,51 +354,40 @@ def download_compatible_chromedriver(major_version):
             # Chrome 114 and below use old API
             api_url = f"https://chromedriver.storage.googleapis.com/LATEST_RELEASE_{major_version}"
             try:
-                response = requests.get(api_url, timeout=30)
+                response = _download_session.get(api_url, timeout=30)
                 if response.status_code == 200:
                     driver_version = response.text.strip()
                     download_url = f"https://chromedriver.storage.googleapis.com/{driver_version}/chromedriver_linux64.zip"
                 else:
                     raise Exception(f"Old API returned status {response.status_code}")
             except Exception as e:
-                logger.error(f"❌ Failed to get ChromeDriver version for Chrome {major_version}: {e}")
+                logger.error("❌ Failed to get ChromeDriver version for Chrome %s: %s", major_version, e)
                 return None
         
-        logger.info(f"📥 Downloading ChromeDriver {driver_version} from: {download_url}")
+        logger.info("📥 Downloading ChromeDriver %s from: %s", driver_version, download_url)
         
         # Download ChromeDriver
         zip_path = os.path.join(driver_dir, "chromedriver.zip")
         
         try:
-            response = requests.get(download_url, timeout=120)
-            response.raise_for_status()
-            
-            with open(zip_path, 'wb') as f:
-                f.write(response.content)
+            # Stream straight to disk instead of holding the whole zip in memory
+            with _download_session.get(download_url, timeout=120, stream=True) as response:
+                response.raise_for_status()
+                with open(zip_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f)
             
             logger.info("📂 Extracting ChromeDriver...")
             
-            # Extract the zip file
+            # Only the binary is needed, not the LICENSE and notices shipped next to it.
+            # Chrome for Testing zips nest it in chromedriver-linux64/, older ones don't
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(driver_dir)
-            
-            # Find the chromedriver executable in extracted files
-            chromedriver_found = False
-            for root, dirs, files in os.walk(driver_dir):
-                for file in files:
-                    if file == "chromedriver":
-                        extracted_path = os.path.join(root, file)
-                        # Move to expected location if not already there
-                        if extracted_path != driver_path:
-                            shutil.move(extracted_path, driver_path)
-                        chromedriver_found = True
-                        break
-                if chromedriver_found:
-                    break
-            
-            if not chromedriver_found:
-                logger.error("❌ ChromeDriver executable not found in downloaded files")
-                return None
+                names = set(zip_ref.namelist())
+                member = next((name for name in ("chromedriver-linux64/chromedriver", "chromedriver") if name in names), None)
+                if member is None:
+                    logger.error("❌ ChromeDriver executable not found in downloaded files")
+                    return None
+                with zip_ref.open(member) as src, open(driver_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
             
             # Make executable
             os.chmod(driver_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
@@ -210,50 +400,89 @@ def download_compatible_chromedriver(major_version):
             result = subprocess.run([driver_path, "--version"], 
                                   capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
-                logger.info(f"✅ ChromeDriver working: {result.stdout.strip()}")
+                logger.info("✅ ChromeDriver working: %s", result.stdout.strip())
                 return driver_path
             else:
-                logger.error(f"❌ Downloaded ChromeDriver test failed: {result.stderr}")
+                logger.error("❌ Downloaded ChromeDriver test failed: %s", result.stderr)
+                shutil.rmtree(driver_dir, ignore_errors=True)
                 return None
                 
         except requests.RequestException as e:
-            logger.error(f"❌ Failed to download ChromeDriver: {e}")
+            logger.error("❌ Failed to download ChromeDriver: %s", e)
             return None
             
     except Exception as e:
-        logger.error(f"❌ ChromeDriver download error: {e}")
+        logger.error("❌ ChromeDriver download error: %s", e)
         return None
 
 def setup_chromedriver_and_chrome():
     """Setup ChromeDriver with automatic version matching"""
+    global _chrome_setup
+    
+    # Chrome and ChromeDriver don't change while the bot runs, so only resolve them once
+    if _chrome_setup:
+        return _chrome_setup
+    
     try:
         # Find Chrome binary
         chrome_binary = find_chrome_binary()
         if not chrome_binary:
             logger.error("❌ Chrome binary not found")
+            find_chrome_binary.cache_clear()
             return None, None
         
         # Get Chrome version
         chrome_version, major_version = get_chrome_version(chrome_binary)
         if not chrome_version or not major_version:
             logger.error("❌ Could not determine Chrome version")
+            get_chrome_version.cache_clear()
             return None, None
         
-        # Always download a fresh ChromeDriver to ensure compatibility
-        logger.info("📥 Downloading compatible ChromeDriver...")
+        # Use the ChromeDriver matching this Chrome major, downloading it only if it isn't cached yet
         chromedriver_path = download_compatible_chromedriver(major_version)
         
         if not chromedriver_path:
-            logger.error("❌ Could not download compatible ChromeDriver")
+            logger.error("❌ Could not get a compatible ChromeDriver")
             return None, None
         
-        logger.info(f"✅ ChromeDriver setup complete: {chromedriver_path}")
-        return chromedriver_path, chrome_binary
+        logger.info("✅ ChromeDriver setup complete: %s", chromedriver_path)
+        _chrome_setup = (chromedriver_path, chrome_binary)
+        return _chrome_setup
             
     except Exception as e:
-        logger.error(f"❌ ChromeDriver setup error: {e}")
+        logger.error("❌ ChromeDriver setup error: %s", e)
         return None, None
 
+def reset_chrome_setup():
+    """Forget the resolved Chrome and ChromeDriver so the next setup starts from scratch"""
+    global _chrome_setup
+    
+    _chrome_setup = None
+    find_chrome_binary.cache_clear()
+    get_chrome_version.cache_clear()
+
+def is_downloaded_chromedriver(driver_path):
+    """Whether a ChromeDriver path is one of our cached downloads rather than a system or Railway one"""
+    driver_dir = os.path.dirname(os.path.abspath(driver_path))
+    return os.path.dirname(driver_dir) == CHROMEDRIVER_CACHE_DIR
+
+def chromedriver_is_unusable(driver_path, start_error):
+    """Tell a ChromeDriver that can't drive this Chrome apart from a Chrome that merely failed to start"""
+    if "only supports Chrome version" in str(start_error):
+        return True
+    try:
+        result = subprocess.run([driver_path, "--version"],
+                              capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return True
+    return result.returncode != 0
+
+def probe_chrome_setup():
+    """Resolve Chrome and ChromeDriver up front so the first browser fallback doesn't pay for it"""
+    chromedriver_path, chrome_binary = setup_chromedriver_and_chrome()
+    if not chromedriver_path:
+        logger.error("❌ Browser fallback unavailable: Chrome/ChromeDriver setup failed, will retry on first use")
+
 def create_chrome_options(chrome_binary):
     """Create optimized Chrome options for Railway deployment"""
     options = Options()
@@ -269,26 +498,42 @@ def create_chrome_options(chrome_binary):
     options.add_argument("--disable-extensions")
     options.add_argument("--disable-plugins")
     options.add_argument("--window-size=1920,1080")
-    options.add_argument("--remote-debugging-port=9222")
     
     # Railway/Container specific options
-    options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-software-rasterizer")
     options.add_argument("--disable-background-timer-throttling")
     options.add_argument("--disable-backgrounding-occluded-windows")
     options.add_argument("--disable-renderer-backgrounding")
-    options.add_argument("--disable-features=TranslateUI")
-    options.add_argument("--disable-features=VizDisplayCompositor")
     options.add_argument("--disable-ipc-flooding-protection")
     options.add_argument("--memory-pressure-off")
     
+    # Chrome only honours the last --disable-features switch, so pass them all at once
+    options.add_argument(f"--disable-features={','.join(CHROME_DISABLED_FEATURES)}")
+    
     # Reduce resource usage for Railway
-    options.add_argument("--max_old_space_size=4096")
+    options.add_argument("--no-zygote")
+    options.add_argument("--no-first-run")
+    options.add_argument("--no-default-browser-check")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-default-apps")
+    options.add_argument("--mute-audio")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-client-side-phishing-detection")
+    options.add_argument("--disable-component-update")
+    options.add_argument("--disable-domain-reliability")
+    options.add_argument("--disable-breakpad")
     options.add_argument("--disable-logging")
     options.add_argument("--disable-dev-tools")
     options.add_argument("--log-level=3")
     options.add_argument("--silent")
     
+    # Skip image downloads; the price is plain text
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    
+    # Return from driver.get() on DOMContentLoaded; the price is rendered by JS afterwards anyway
+    options.page_load_strategy = "eager"
+    
     # Anti-detection measures
     options.add_argument("--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36")
     options.add_argument("--disable-blink-features=AutomationControlled")
@@ -297,271 +542,407 @@ def create_chrome_options(chrome_binary):
     
     return options
 
-def wait_for_page_ready(driver, timeout=60):
-    """Wait for page to be fully loaded including JavaScript"""
+def get_driver():
+    """Return the shared Chrome WebDriver, starting it on first use"""
+    global _driver, _driver_uses
+    
+    if _driver is not None:
+        # Reuse the browser only while chromedriver still answers and it hasn't aged out
+        if _driver_uses >= MAX_DRIVER_USES:
+            logger.info("♻️ Browser served %s page loads, restarting it", _driver_uses)
+            quit_driver()
+        elif _driver.service.is_connectable():
+            _driver_uses += 1
+            return _driver
+        else:
+            logger.warning("⚠️ ChromeDriver stopped responding, restarting browser")
+            quit_driver()
+    
+    # Setup ChromeDriver and Chrome
+    chromedriver_path, chrome_binary = setup_chromedriver_and_chrome()
+    if not chromedriver_path or not chrome_binary:
+        logger.error("❌ Chrome/ChromeDriver setup failed")
+        return None
+    
+    # Create Chrome options
+    options = create_chrome_options(chrome_binary)
+    
+    # Create service
+    service = Service(executable_path=chromedriver_path)
+    
+    # Initialize WebDriver
+    logger.info("🚀 Starting Chrome WebDriver...")
     try:
-        # Wait for document ready state
-        WebDriverWait(driver, timeout).until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
-        )
-        
-        # Wait a bit more for dynamic content
-        time.sleep(3)
-        
-        # Wait for jQuery if it exists
-        try:
-            WebDriverWait(driver, 10).until(
-                lambda d: d.execute_script("return typeof jQuery === 'undefined' || jQuery.active === 0")
-            )
-        except:
-            pass  # jQuery might not be present
-        
-        logger.info("✅ Page fully loaded")
-        return True
-        
-    except TimeoutException:
-        logger.warning("⚠️ Page load timeout, continuing anyway")
-        return False
+        driver = webdriver.Chrome(service=service, options=options)
+    except WebDriverException as start_error:
+        # The cached paths may be what's broken (e.g. Chrome upgraded underneath us)
+        reset_chrome_setup()
+        # A driver we downloaded ourselves is only re-fetched when it is actually the problem,
+        # not every time Chrome crashes on startup
+        if is_downloaded_chromedriver(chromedriver_path) and chromedriver_is_unusable(chromedriver_path, start_error):
+            logger.warning("⚠️ Discarding cached ChromeDriver %s", chromedriver_path)
+            shutil.rmtree(os.path.dirname(chromedriver_path), ignore_errors=True)
+        raise
+    
+    # Set timeouts; with eager loading a healthy page reaches DOMContentLoaded well within this
+    driver.set_page_load_timeout(20)
+    driver.set_script_timeout(10)  # A wedged page shouldn't hang the price lookup script
+    driver.implicitly_wait(0)  # Explicit waits only; implicit waits stack on every lookup
+    
+    # Block analytics and other third-party requests before any page loads
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except WebDriverException as cdp_error:
+        logger.warning("⚠️ Could not set blocked URLs: %s", cdp_error)
+    
+    _driver = driver
+    _driver_uses = 1
+    return _driver
+
+def quit_driver():
+    """Close the shared Chrome WebDriver so the next fetch starts a fresh one"""
+    global _driver, _driver_failures, _driver_uses
+    
+    _driver_failures = 0
+    _driver_uses = 0
+    if _driver is None:
+        return
+    
+    driver, _driver = _driver, None
+    try:
+        driver.quit()
+        logger.info("🔄 Chrome WebDriver closed")
+    except Exception as close_error:
+        logger.warning("⚠️ Error closing WebDriver: %s", close_error)
+
+atexit.register(quit_driver)
 
 def fetch_price_attempt(attempt_num=1, max_attempts=3):
     """Single attempt to fetch price with improved error handling"""
-    driver = None
-    
     try:
-        logger.info(f"🔄 Price fetch attempt {attempt_num}/{max_attempts}")
+        logger.debug("🔄 Price fetch attempt %s/%s", attempt_num, max_attempts)
         
-        # Setup ChromeDriver and Chrome
-        chromedriver_path, chrome_binary = setup_chromedriver_and_chrome()
-        if not chromedriver_path or not chrome_binary:
-            logger.error("❌ Chrome/ChromeDriver setup failed")
+        # Reuse the running browser instead of relaunching Chrome every cycle
+        driver = get_driver()
+        if not driver:
             return None
         
-        # Create Chrome options
-        options = create_chrome_options(chrome_binary)
-        
-        # Create service
-        service = Service(executable_path=chromedriver_path)
+        # The browser is shared across cycles; start each load without the last one's cookies
+        driver.delete_all_cookies()
         
-        # Initialize WebDriver
-        logger.info("🚀 Starting Chrome WebDriver...")
-        driver = webdriver.Chrome(service=service, options=options)
-        
-        # Set timeouts - increased for better reliability
-        driver.set_page_load_timeout(120)  # Increased from 90
-        driver.implicitly_wait(10)  # Reduced from 30 to avoid long waits on missing elements
-        
-        logger.info("🌐 Loading Nirvana Finance page...")
+        logger.debug("🌐 Loading Nirvana Finance page...")
+        load_started = time.monotonic()
         driver.get("https://mainnet.nirvana.finance/mint")
-        
-        # Wait for page to be fully ready
-        logger.info("⏳ Waiting for page to be fully loaded...")
-        wait_for_page_ready(driver, timeout=90)
-        
-        # Additional wait for dynamic content to load
-        logger.info("⏳ Waiting for dynamic content...")
-        time.sleep(10)  # Increased from 5 seconds
-        
-        # Create longer wait object for finding elements
-        wait = WebDriverWait(driver, 60)  # Reduced from 90 to avoid excessive waits
-        
-        # Try multiple selectors to find the price
-        selectors_to_try = [
-            ("CLASS_NAME", "DataPoint_dataPointValue__Bzf_E"),
-            ("CSS_SELECTOR", "[class*='DataPoint_dataPointValue']"),
-            ("CSS_SELECTOR", "[class*='dataPointValue']"),
-            ("CSS_SELECTOR", "[data-testid*='price']"),
-            ("CSS_SELECTOR", ".price-value"),
-            ("CSS_SELECTOR", "[class*='price']"),
-            ("XPATH", "//span[contains(@class, 'DataPoint')]"),
-            ("XPATH", "//div[contains(@class, 'DataPoint')]//span"),
-        ]
+        logger.debug("🌐 Page loaded in %.1fs", time.monotonic() - load_started)
         
         price_text = None
         successful_selector = None
         
-        for selector_type, selector in selectors_to_try:
-            try:
-                logger.info(f"🔍 Trying {selector_type}: {selector}")
-                
-                if selector_type == "CLASS_NAME":
-                    element = wait.until(EC.presence_of_element_located((By.CLASS_NAME, selector)))
-                elif selector_type == "CSS_SELECTOR":
-                    element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                elif selector_type == "XPATH":
-                    element = wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-                
-                # Wait for element to be visible and have text
-                wait.until(EC.visibility_of(element))
-                
-                # Additional wait for content to populate
-                time.sleep(5)
-                
-                # Get text content
-                price_text = element.text.strip()
-                logger.info(f"📝 Found text with {selector_type} '{selector}': '{price_text}'")
-                
-                if price_text and price_text != "":
-                    successful_selector = f"{selector_type}: {selector}"
-                    break
-                    
-            except TimeoutException:
-                logger.debug(f"⏳ {selector_type} '{selector}' timed out")
-                continue
-            except Exception as e:
-                logger.debug(f"⚠️ {selector_type} '{selector}' failed: {e}")
-                continue
+        # The only wait in the fetch: polls until the SPA renders the price element, or gives up
+        try:
+            price_text, successful_selector = WebDriverWait(driver, 15, poll_frequency=0.25).until(
+                lambda d: d.execute_script(_FIND_PRICE_JS, [PRICE_SELECTOR])
+            )
+            logger.debug("⏱️ Price rendered %.1fs after navigation", time.monotonic() - load_started)
+        except TimeoutException:
+            # The class name may have changed in a redeploy; check the looser locators once
+            logger.debug("⏳ %s didn't render a price within the wait, trying fallbacks", PRICE_SELECTOR)
+            found = driver.execute_script(_FIND_PRICE_JS, FALLBACK_PRICE_SELECTORS)
+            if found:
+                price_text, successful_selector = found
         
         # Process the found price text
         if price_text:
-            logger.info(f"✅ Price found using {successful_selector}")
-            
-            # Clean the price text
-            original_price = price_text
-            cleaned_price = price_text.replace("USDC", "").replace("$", "").replace(",", "").strip()
-            
-            logger.info(f"🧹 Cleaned '{original_price}' to '{cleaned_price}'")
+            logger.debug("📝 Found text with '%s': '%s'", successful_selector, price_text)
             
+            cleaned_price = _parse_price(price_text)
             if cleaned_price:
-                try:
-                    # Validate it's a valid number
-                    price_float = float(cleaned_price)
-                    logger.info(f"✅ Valid price extracted: {cleaned_price} (${price_float:.4f})")
-                    return cleaned_price
-                except ValueError:
-                    logger.warning(f"⚠️ Invalid number format: '{cleaned_price}'")
-                    return None
+                logger.debug("✅ Valid price extracted: '%s' -> %s", price_text, cleaned_price)
+                return cleaned_price
             else:
-                logger.warning("⚠️ Price text empty after cleaning")
+                logger.warning("⚠️ No number found in price text: '%s'", price_text)
                 return None
         else:
             logger.warning("⚠️ No price found with any selector")
             
-            # Limited debug info - avoid timeouts
-            try:
-                page_title = driver.title
-                current_url = driver.current_url
-                page_source_length = len(driver.page_source)
-                
-                logger.info(f"📄 Page title: '{page_title}'")
-                logger.info(f"🔗 Current URL: {current_url}")
-                logger.info(f"📊 Page source length: {page_source_length} chars")
+            # Limited debug info - avoid timeouts; only at DEBUG since it costs another round-trip
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    # Inspect the DOM in the browser so the full page source never crosses the wire
+                    page_title, current_url, page_source_length, has_data_point = driver.execute_script(
+                        "const html = document.documentElement.outerHTML;"
+                        "return [document.title, location.href, html.length, html.includes('DataPoint')];"
+                    )
                 
-                # Quick check for DataPoint in source
-                if "DataPoint" in driver.page_source:
-                    logger.info("✅ Found 'DataPoint' in page source")
-                else:
-                    logger.warning("⚠️ No 'DataPoint' found in page source")
+                    logger.debug("📄 Page title: '%s'", page_title)
+                    logger.debug("🔗 Current URL: %s", current_url)
+                    logger.debug("📊 Page source length: %s chars", page_source_length)
                 
-                # Skip screenshot to avoid timeouts
-                logger.info("📸 Skipping screenshot to avoid timeout issues")
+                    # Quick check for DataPoint in source
+                    if has_data_point:
+                        logger.debug("✅ Found 'DataPoint' in page source")
+                    else:
+                        logger.debug("⚠️ No 'DataPoint' found in page source")
                 
-            except Exception as debug_error:
-                logger.warning(f"⚠️ Debug info failed: {debug_error}")
+                except Exception as debug_error:
+                    logger.warning("⚠️ Debug info failed: %s", debug_error)
             
             return None
             
     except TimeoutException as e:
-        logger.error(f"⏳ Timeout in attempt {attempt_num}: {str(e)}")
+        # A slow page doesn't mean the browser is broken; keep it for the next attempt
+        logger.error("⏳ Timeout in attempt %s: %s", attempt_num, e)
         return None
     except WebDriverException as e:
-        logger.error(f"🌐 WebDriver error in attempt {attempt_num}: {str(e)}")
+        # Session-level failure (crashed tab, dead chromedriver); rebuild on next attempt
+        logger.error("🌐 WebDriver error in attempt %s: %s", attempt_num, e)
+        quit_driver()
         return None
     except Exception as e:
-        logger.error(f"❌ Unexpected error in attempt {attempt_num}: {str(e)}")
-        logger.error(f"❌ Error type: {type(e).__name__}")
+        logger.error("❌ Unexpected error in attempt %s: %s", attempt_num, e)
+        logger.error("❌ Error type: %s", type(e).__name__)
+        quit_driver()
         return None
-        
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                logger.info("🔄 Chrome WebDriver closed")
-            except Exception as close_error:
-                logger.warning(f"⚠️ Error closing WebDriver: {close_error}")
 
-def fetch_price():
-    """Fetch ANA price from Nirvana Finance with retry logic"""
+async def fetch_price_via_browser():
+    """Scrape ANA price from Nirvana Finance with retry logic; fallback for when the price API fails"""
+    global _driver_failures
+    
+    loop = asyncio.get_running_loop()
     max_attempts = 3
     base_delay = 30  # Base delay between retries in seconds
     
+    # Each attempt runs on the scraper thread; the backoff waits on the event loop instead
     for attempt in range(1, max_attempts + 1):
         try:
-            price = fetch_price_attempt(attempt, max_attempts)
+            price = await loop.run_in_executor(_fetch_executor, fetch_price_attempt, attempt, max_attempts)
             
             if price is not None:
-                logger.info(f"✅ Price fetched successfully on attempt {attempt}: ${price}")
+                logger.info("✅ Price fetched successfully on attempt %s: $%s", attempt, price)
+                _driver_failures = 0
                 return price
             
+            # A browser that keeps failing without erroring out is likely wedged; recycle it
+            _driver_failures += 1
+            if _driver_failures >= MAX_DRIVER_FAILURES:
+                logger.warning("⚠️ %s failed attempts in a row, restarting browser", _driver_failures)
+                await loop.run_in_executor(_fetch_executor, quit_driver)
+            
             # If not the last attempt, wait before retrying
             if attempt < max_attempts:
                 # Exponential backoff with jitter
                 delay = base_delay * (2 ** (attempt - 1)) + random.randint(5, 15)
-                logger.info(f"⏳ Attempt {attempt} failed, waiting {delay} seconds before retry...")
-                time.sleep(delay)
+                logger.info("⏳ Attempt %s failed, waiting %s seconds before retry...", attempt, delay)
+                await asyncio.sleep(delay)
             
         except Exception as e:
-            logger.error(f"❌ Critical error in attempt {attempt}: {e}")
+            logger.error("❌ Critical error in attempt %s: %s", attempt, e)
             if attempt < max_attempts:
                 delay = base_delay + random.randint(10, 20)
-                logger.info(f"⏳ Critical error, waiting {delay} seconds before retry...")
-                time.sleep(delay)
+                logger.info("⏳ Critical error, waiting %s seconds before retry...", delay)
+                await asyncio.sleep(delay)
     
-    logger.error(f"❌ All {max_attempts} attempts failed")
+    logger.error("❌ All %s attempts failed", max_attempts)
     return None
 
-@tasks.loop(seconds=180)  # Increased from 120 to 180 seconds (3 minutes)
+async def fetch_prices_from_api():
+    """Fetch prices for every tracked asset from the Jupiter price API in one request"""
+    global _api_etag, _api_prices
+    
+    if http_session is None or http_session.closed:
+        return {}
+    
+    try:
+        timeout = aiohttp.ClientTimeout(total=5)
+        params = {"ids": ",".join(PRICE_ASSETS.values())}
+        # Let the API answer 304 instead of resending prices we already have
+        headers = {"If-None-Match": _api_etag} if _api_etag and _api_prices else None
+        async with http_session.get(PRICE_API_URL, params=params, headers=headers, timeout=timeout) as response:
+            if response.status == 304:
+                logger.debug("♻️ Price API unchanged, reusing last prices")
+                return dict(_api_prices)
+            if response.status != 200:
+                logger.warning("⚠️ Price API returned %s", response.status)
+                return {}
+            etag = response.headers.get("ETag")
+            payload = await response.json(loads=orjson.loads)
+        
+        # v3 returns {mint: {"usdPrice": ...}}, v2 wraps it as {"data": {mint: {"price": ...}}}
+        entries = payload.get("data", payload)
+        prices = {}
+        for symbol, mint in PRICE_ASSETS.items():
+            entry = entries.get(mint) or {}
+            price = _parse_price(entry.get("usdPrice", entry.get("price")))
+            if price is None:
+                logger.warning("⚠️ Price API has no usable price for %s (%s)", symbol, mint)
+                continue
+            prices[symbol] = price
+        
+        _api_etag, _api_prices = etag, prices
+        logger.info("✅ Prices fetched from API: %s", prices)
+        return prices
+        
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning("⚠️ Price API request failed: %s", e)
+        return {}
+    except (AttributeError, TypeError, ValueError) as e:
+        logger.warning("⚠️ Unexpected price API response: %s", e)
+        return {}
+
+async def fetch_price_from_api():
+    """Fetch ANA price from the Jupiter price API without launching a browser"""
+    prices = await fetch_prices_from_api()
+    return prices.get("ANA")
+
+async def fetch_price():
+    """Fetch ANA price from the price API, falling back to the browser scrape"""
+    price = await fetch_price_from_api()
+    if price is not None:
+        return price
+    
+    if not BROWSER_FALLBACK:
+        logger.warning("⚠️ Price API unavailable and the browser fallback is disabled")
+        return None
+    if not SELENIUM_AVAILABLE:
+        logger.warning("⚠️ Price API unavailable and selenium is not installed for the browser fallback")
+        return None
+    
+    logger.info("🌐 Price API unavailable, falling back to browser scrape...")
+    return await fetch_price_via_browser()
+
+def load_last_price():
+    """Read the last channel price saved by a previous run"""
+    try:
+        return LAST_PRICE_PATH.read_text().strip() or None
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning("⚠️ Could not read last price from %s: %s", LAST_PRICE_PATH, e)
+        return None
+
+def save_last_price(price):
+    """Save the channel price atomically so a crash never leaves a partial file"""
+    tmp_path = LAST_PRICE_PATH.with_name(LAST_PRICE_PATH.name + ".tmp")
+    try:
+        tmp_path.write_text(price)
+        os.replace(tmp_path, LAST_PRICE_PATH)
+    except OSError as e:
+        logger.warning("⚠️ Could not save last price to %s: %s", LAST_PRICE_PATH, e)
+
+def seconds_until_channel_edit():
+    """Return how long until another channel rename fits in Discord's rate limit"""
+    now = time.monotonic()
+    while _channel_edits and now - _channel_edits[0] >= CHANNEL_EDIT_WINDOW:
+        _channel_edits.popleft()
+    if len(_channel_edits) < CHANNEL_EDIT_LIMIT:
+        return 0
+    return CHANNEL_EDIT_WINDOW - (now - _channel_edits[0])
+
+def adjust_poll_interval(price_settled):
+    """Poll less often while the channel already shows the price, and reset when it moves"""
+    global _unchanged_cycles, _poll_interval
+    
+    if price_settled:
+        _unchanged_cycles += 1
+        backoff = 2 ** (_unchanged_cycles // UNCHANGED_CYCLES_BEFORE_BACKOFF)
+        interval = min(POLL_INTERVAL * backoff, MAX_POLL_INTERVAL)
+    else:
+        _unchanged_cycles = 0
+        interval = POLL_INTERVAL
+    
+    if interval != _poll_interval:
+        _poll_interval = interval
+        logger.info("⏱️ Poll interval set to %ss", interval)
+    
+    # tasks.loop counts from the start of this run, so a slow fetch never stacks iterations
+    update_bot_status.change_interval(seconds=interval + random.uniform(0, POLL_JITTER))
+
+async def update_presence(price):
+    """Show the price in the bot's status"""
+    global last_status_price
+    
+    try:
+        await client.change_presence(activity=discord.Game(name=f"📊ANA Price: ${price}"))
+        logger.info("✅ Bot status updated: 📊ANA Price: $%s", price)
+        last_status_price = price
+    except Exception as status_error:
+        logger.error("❌ Status update failed: %s", status_error)
+
+async def update_channel(price):
+    """Rename the voice channel to the price, staying inside Discord's rename rate limit"""
+    global last_price, _pending_count
+    
+    edit_wait = seconds_until_channel_edit()
+    channel = client.get_channel(VOICE_CHANNEL_ID)
+    if edit_wait > 0:
+        logger.info("⏳ Skipping channel edit, next rename allowed in %.0fs", edit_wait)
+    elif channel and isinstance(channel, discord.VoiceChannel):
+        try:
+            channel_name = f"📊ANA Price: ${price}"
+            await channel.edit(name=channel_name)
+            logger.info("🔁 Channel updated: %s", channel_name)
+            last_price = price
+            _pending_count = 0
+            _channel_edits.append(time.monotonic())
+            save_last_price(price)
+        except discord.Forbidden:
+            logger.error("❌ No permission to edit channel")
+        except discord.HTTPException as http_error:
+            if "rate limited" in str(http_error).lower():
+                logger.warning("⚠️ Rate limited, will retry next cycle")
+            else:
+                logger.error("❌ Channel edit failed: %s", http_error)
+        except Exception as channel_error:
+            logger.error("❌ Channel update error: %s", channel_error)
+    else:
+        logger.warning("⚠️ Channel %s not found or invalid", VOICE_CHANNEL_ID)
+
+@tasks.loop(seconds=POLL_INTERVAL)
 async def update_bot_status():
     """Update bot status and channel name"""
-    global last_price
-    
-    if not client.is_ready():
-        logger.info("⏳ Bot not ready, skipping update...")
-        return
+    global _pending_count
     
     try:
-        logger.info("🔄 Starting price update...")
+        logger.debug("🔄 Starting price update...")
         
-        # Fetch price in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        price = await loop.run_in_executor(None, fetch_price)
+        price = await fetch_price()
         
         if price:
+            adjust_poll_interval(price == last_price)
+            
+            # Presence doesn't survive a restart, so it's tracked separately from the channel
+            updates = []
+            if price != last_status_price:
+                updates.append(update_presence(price))
             if price != last_price:
-                logger.info(f"📈 Price update: {last_price} → {price}")
+                # Debounce renames so a one-poll blip doesn't burn the rename budget; the value
+                # may keep drifting meanwhile, the channel then gets whatever is current
+                _pending_count += 1
                 
-                # Update bot status
-                try:
-                    await client.change_presence(activity=discord.Game(name=f"📊ANA Price: ${price}"))
-                    logger.info(f"✅ Bot status updated: 📊ANA Price: ${price}")
-                except Exception as status_error:
-                    logger.error(f"❌ Status update failed: {status_error}")
-                
-                # Update voice channel
-                channel = client.get_channel(VOICE_CHANNEL_ID)
-                if channel and isinstance(channel, discord.VoiceChannel):
-                    try:
-                        channel_name = f"📊ANA Price: ${price}"
-                        await channel.edit(name=channel_name)
-                        logger.info(f"🔁 Channel updated: {channel_name}")
-                        last_price = price
-                    except discord.Forbidden:
-                        logger.error("❌ No permission to edit channel")
-                    except discord.HTTPException as http_error:
-                        if "rate limited" in str(http_error).lower():
-                            logger.warning("⚠️ Rate limited, will retry next cycle")
-                        else:
-                            logger.error(f"❌ Channel edit failed: {http_error}")
-                    except Exception as channel_error:
-                        logger.error(f"❌ Channel update error: {channel_error}")
+                if last_price is None or _pending_count >= CHANNEL_EDIT_CONFIRMATIONS:
+                    logger.info("📈 Price update: %s → %s", last_price, price)
+                    updates.append(update_channel(price))
                 else:
-                    logger.warning(f"⚠️ Channel {VOICE_CHANNEL_ID} not found or invalid")
+                    logger.info("⏳ Price moved to $%s, confirming on the next poll before renaming", price)
             else:
-                logger.info(f"⏸️ Price unchanged: ${price}")
+                _pending_count = 0
+                logger.debug("⏸️ Price unchanged: $%s", price)
+            
+            # Both are independent Discord requests, so send them together
+            for result in await asyncio.gather(*updates, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error("❌ Discord update error: %s", result)
         else:
             logger.warning("⚠️ Price fetch failed after all retries, will try again next cycle")
             
     except Exception as update_error:
-        logger.error(f"⚠️ Update cycle error: {update_error}")
+        logger.error("⚠️ Update cycle error: %s", update_error)
+
+@update_bot_status.before_loop
+async def wait_until_ready():
+    """Hold the first update until the gateway is ready"""
+    await client.wait_until_ready()
 
 @client.event
 async def on_ready():
@@ -579,16 +960,6 @@ async def on_ready():
             logger.error(f"❌ Channel {VOICE_CHANNEL_ID} is not a voice channel!")
     else:
         logger.error(f"❌ Channel {VOICE_CHANNEL_ID} not found!")
-    
-    # Test system setup
-    logger.info("🧪 Testing system setup...")
-    chrome_binary = find_chrome_binary()
-    if chrome_binary:
-        get_chrome_version(chrome_binary)
-    
-    # Start update loop
-    logger.info("🚀 Starting price monitoring...")
-    update_bot_status.start()
 
 @client.event
 async def on_disconnect():
@@ -602,6 +973,40 @@ async def on_resumed():
 async def on_error(event, *args, **kwargs):
     logger.error(f"❌ Discord error in {event}")
 
+async def run_bot():
+    """Run the Discord client with the shared price API session open for its lifetime"""
+    global http_session, last_price
+    
+    # Restore the price the channel was last renamed to
+    last_price = load_last_price()
+    if last_price:
+        logger.info("💾 Restored last price: $%s", last_price)
+    
+    # Test system setup once per process, in the background while the bot logs in;
+    # on_ready fires again on every reconnect so it's the wrong place for this
+    if SELENIUM_AVAILABLE and BROWSER_FALLBACK:
+        logger.info("🧪 Testing system setup...")
+        asyncio.get_running_loop().run_in_executor(_fetch_executor, probe_chrome_setup)
+    
+    # Reuse the price API's DNS answer across cycles instead of resolving it every poll
+    connector = aiohttp.TCPConnector(limit=4, ttl_dns_cache=600)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        http_session = session
+        async with client:
+            # Container stops send SIGTERM, which skips atexit; close the client instead so
+            # run_bot returns, the process exits normally and quit_driver shuts Chrome down
+            try:
+                asyncio.get_running_loop().add_signal_handler(
+                    signal.SIGTERM, lambda: asyncio.ensure_future(client.close())
+                )
+            except NotImplementedError:
+                pass  # No signal handlers on Windows event loops
+            
+            # Started once here rather than in on_ready, which fires again on every reconnect
+            logger.info("🚀 Starting price monitoring...")
+            update_bot_status.start()
+            await client.start(DISCORD_BOT_TOKEN)
+
 def main():
     """Main function"""
     logger.info("🚀 📊ANA Price Bot Starting...")
@@ -615,10 +1020,15 @@ def main():
     if VOICE_CHANNEL_ID:
         logger.info(f"✅ Channel ID: {VOICE_CHANNEL_ID}")
     
+    # Run the gateway and price API traffic on libuv when available
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("⚡ Using uvloop event loop")
+    
     # Start bot
     try:
         logger.info("🤖 Starting Discord bot...")
-        client.run(DISCORD_BOT_TOKEN)
+        asyncio.run(run_bot())
     except KeyboardInterrupt:
         logger.info("👋 Bot stopped by user")
     except Exception as start_error: